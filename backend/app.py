@@ -3,18 +3,65 @@ Flask API for Sokoban Solver
 Handles HTTP requests from the React frontend
 """
 
-from flask import Flask, request, jsonify
+from functools import lru_cache
+import hashlib
+from typing import Tuple
+
+import msgspec
+import numpy as np
+from flask import Flask, Response, request
 from flask_cors import CORS
 from solver import SokobanSolver
 from levels import get_random_level, get_all_levels, get_level_count
-import json
+
+try:
+    import orjson
+except ImportError:  # Dev boxes without orjson fall back to the stdlib
+    orjson = None
+    import json
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
 
+
+def _dumps(obj) -> bytes:
+    """Serialize obj to JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Parse a JSON request body (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def ojsonify(obj) -> Response:
+    """Drop-in replacement for flask.jsonify backed by orjson"""
+    return Response(_dumps(obj), mimetype='application/json')
+
+
+@lru_cache(maxsize=512)
+def _solve_cached(map_key: Tuple[str, ...], algorithm: str) -> bytes:
+    """
+    Solve a map and return the serialized result.
+    
+    Clients resubmit the same levels constantly (retries, restarts, the
+    fixed level pool), so repeat solves are served from this cache. The
+    cached "time" is how long the original solve took.
+    """
+    return msgspec.json.encode(SokobanSolver(list(map_key)).solve(algorithm))
+
+
 # Levels are now loaded from levels.py
 # No need to hardcode them here
 
+# The level set is constant, so serialize it once at import time
+_LEVELS_JSON = _dumps({'success': True, 'levels': get_all_levels()})
+_LEVELS_ETAG = hashlib.sha1(_LEVELS_JSON).hexdigest()
+
 
 @app.route('/api/solve', methods=['POST'])
 def solve():
@@ -24,37 +71,37 @@ def solve():
     Request body:
     {
         "map": ["####", "#@$#", ...],  // Game map
-        "algorithm": "astar"            // bfs, dfs, or astar
+        "algorithm": "astar"            // bfs, dfs, astar, idastar, bidirectional
     }
     
     Response:
     {
         "success": true,
-        "path": ["U", "R", "D", ...],
+        "path": "URD...",
         "nodes_explored": 123,
         "time": 0.045,
-        "algorithm": "A*"
+        "algorithm": "A*",
+        "error": null
     }
     """
     try:
-        data = request.json
+        data = _loads(request.get_data())
         game_map = data.get('map')
         algorithm = data.get('algorithm', 'astar')
         
         if not game_map:
-            return jsonify({
+            return ojsonify({
                 'success': False,
                 'error': 'No map provided'
             }), 400
         
-        # Create solver and solve
-        solver = SokobanSolver(game_map)
-        result = solver.solve(algorithm)
+        # Solve (or reuse the result for a map we have already solved)
+        body = _solve_cached(tuple(game_map), algorithm)
         
-        return jsonify(result)
+        return Response(body, mimetype='application/json')
     
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -63,10 +110,9 @@ def solve():
 @app.route('/api/levels', methods=['GET'])
 def get_levels():
     """Get all predefined levels"""
-    return jsonify({
-        'success': True,
-        'levels': get_all_levels()
-    })
+    response = Response(_LEVELS_JSON, mimetype='application/json')
+    response.set_etag(_LEVELS_ETAG)
+    return response.make_conditional(request)
 
 
 @app.route('/api/levels/<level_name>', methods=['GET'])
@@ -81,14 +127,14 @@ def get_level(level_name):
         from levels import _last_level_index
         level_index = _last_level_index.get(level_name, 0) + 1
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'level': level,
             'levelIndex': level_index,
             'totalLevels': total_levels
         })
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': f'Failed to load level: {str(e)}'
         }), 500
@@ -116,24 +162,22 @@ def validate_map():
     }
     """
     try:
-        data = request.json
+        data = _loads(request.get_data())
         game_map = data.get('map')
         
         if not game_map:
-            return jsonify({
+            return ojsonify({
                 'valid': False,
                 'message': 'No map provided'
             }), 400
         
-        # Count elements
-        player_count = 0
-        box_count = 0
-        goal_count = 0
+        # Count elements with a single pass over the whole map
+        buf = np.frombuffer(''.join(game_map).encode('utf-8'), dtype=np.uint8)
+        counts = np.bincount(buf, minlength=256).tolist()
         
-        for row in game_map:
-            player_count += row.count('@') + row.count('+')
-            box_count += row.count('$') + row.count('*')
-            goal_count += row.count('.') + row.count('*') + row.count('+')
+        player_count = counts[ord('@')] + counts[ord('+')]
+        box_count = counts[ord('$')] + counts[ord('*')]
+        goal_count = counts[ord('.')] + counts[ord('*')] + counts[ord('+')]
         
         # Validation
         errors = []
@@ -147,7 +191,7 @@ def validate_map():
             errors.append(f'Number of boxes ({box_count}) must equal number of goals ({goal_count})')
         
         if errors:
-            return jsonify({
+            return ojsonify({
                 'valid': False,
                 'message': '; '.join(errors),
                 'stats': {
@@ -157,7 +201,7 @@ def validate_map():
                 }
             })
         
-        return jsonify({
+        return ojsonify({
             'valid': True,
             'message': 'Map is valid',
             'stats': {
@@ -168,7 +212,7 @@ def validate_map():
         })
     
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'valid': False,
             'message': str(e)
         }), 500
@@ -177,7 +221,7 @@ def validate_map():
 @app.route('/api/health', methods=['GET'])
 def health():
     """Health check endpoint"""
-    return jsonify({
+    return ojsonify({
         'status': 'ok',
         'message': 'Sokoban Solver API is running'
     })
@@ -194,6 +238,9 @@ if __name__ == '__main__':
     print("  POST /api/validate    - Validate a map")
     print("  GET  /api/health      - Health check")
     print("\nServer starting on http://localhost:5000")
+    print("(development server - for production run:")
+    print("  gunicorn -c gunicorn_conf.py app:app)")
     print("="*50 + "\n")
     
+    # Werkzeug dev server only; gunicorn imports `app` and never runs this
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
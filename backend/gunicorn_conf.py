@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration for the Sokoban Solver API
+
+Usage:
+    gunicorn -c gunicorn_conf.py app:app
+
+The solver is CPU-bound, so gevent mostly helps the light endpoints
+(/api/health, /api/levels, /api/validate) stay responsive while solves
+are running. If you don't need that, use plain sync workers instead:
+
+    gunicorn -k sync -w 4 -b 0.0.0.0:5000 app:app
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get('SOKOBAN_BIND', '0.0.0.0:5000')
+
+worker_class = 'gevent'
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_connections = 1000
+
+# Load the app before forking so levels and solver code are shared
+# copy-on-write across workers
+preload_app = True
@@ -1,260 +1,747 @@
 """
 Sokoban Solver - AI Logic Backend
-Implements BFS, DFS, and A* algorithms
+Implements BFS, DFS, A*, IDA*, and bidirectional BFS algorithms
 """
 
 from collections import deque
-from typing import List, Tuple, Set, Optional, Dict
+from itertools import combinations
+from typing import List, Tuple, Optional
 import heapq
 import time
 import json
 
+import msgspec
+
+INF = float('inf')
+
+try:
+    import solver_numba
+except ImportError:  # numba/numpy not installed - pure Python search only
+    solver_numba = None
+
+
+class SolveResponse(msgspec.Struct):
+    """Result of a solve, encoded directly by msgspec for the API"""
+    success: bool
+    path: str = ''  # Moves as one string, e.g. 'UDLR'
+    nodes_explored: int = 0
+    time: float = 0.0
+    algorithm: str = ''
+    error: Optional[str] = None
+
 
 class SokobanState:
-    """Represents a game state"""
+    """Represents a game state
+    
+    Cells are flat indices into the map padded with a one-cell border
+    (see SokobanSolver._pos). The player is a cell index and the boxes
+    are a bitmask with one bit per occupied cell. Walls, goals, and map
+    size never change, so they live on the solver.
+    
+    The hash of (player, boxes) is computed once per state: hashing two
+    ints is cheaper in Python than updating Zobrist keys incrementally.
+    """
+    
+    __slots__ = ('player', 'boxes', '_hash')
     
-    def __init__(self, player: Tuple[int, int], boxes: List[Tuple[int, int]], 
-                 goals: List[Tuple[int, int]], walls: Set[Tuple[int, int]],
-                 width: int, height: int):
+    def __init__(self, player: int, boxes: int):
         self.player = player
-        self.boxes = tuple(sorted(boxes))  # Tuple for hashing
-        self.goals = tuple(sorted(goals))
-        self.walls = walls
-        self.width = width
-        self.height = height
+        self.boxes = boxes  # Bitmask, hashable as-is
+        self._hash = hash((player, boxes))  # States are immutable
     
     def __hash__(self):
-        return hash((self.player, self.boxes))
+        return self._hash
     
     def __eq__(self, other):
         return self.player == other.player and self.boxes == other.boxes
     
-    def is_goal(self) -> bool:
-        """Check if all boxes are on goals"""
-        return set(self.boxes) == set(self.goals)
-    
     def copy(self):
         """Create a copy of the state"""
-        return SokobanState(
-            self.player,
-            list(self.boxes),
-            list(self.goals),
-            self.walls,
-            self.width,
-            self.height
-        )
+        return SokobanState(self.player, self.boxes)
 
 
 class SokobanSolver:
     """AI Solver for Sokoban puzzles"""
     
-    def __init__(self, game_map: List[str]):
+    # (direction, dx, dy), in the order moves are tried
+    MOVES = (('U', 0, -1), ('D', 0, 1), ('L', -1, 0), ('R', 1, 0))
+    
+    def __init__(self, game_map: List[str], use_numba: bool = True):
         self.initial_state = self._parse_map(game_map)
-        self.moves = {'U': (0, -1), 'D': (0, 1), 'L': (-1, 0), 'R': (1, 0)}
+        self._goal_mask = sum(1 << goal for goal in self.goals)
+        # Flat cell offset per direction, as a tuple for the hot loops and
+        # a dict for lookup by move letter
+        self._steps = tuple((move, dy * self._stride + dx) for move, dx, dy in self.MOVES)
+        self._deltas = dict(self._steps)
+        self.dead_mask = self._find_dead_cells()
+        self.min_goal_dist = self._goal_distances()
+        self.use_numba = use_numba and solver_numba is not None
+    
+    def _pos(self, x: int, y: int) -> int:
+        """Flat cell index of (x, y) in the padded map"""
+        return (y + 1) * self._stride + x + 1
+    
+    def _xy(self, pos: int) -> Tuple[int, int]:
+        """Inverse of _pos"""
+        y, x = divmod(pos, self._stride)
+        return x - 1, y - 1
     
     def _parse_map(self, game_map: List[str]) -> SokobanState:
-        """Parse the game map and extract initial state"""
+        """Parse the game map into solver constants and the initial state"""
         player = None
-        boxes = []
+        boxes = 0
         goals = []
-        walls = set()
         
         height = len(game_map)
         width = max(len(row) for row in game_map)
         
+        # Pad with a wall border so moves can never leave the map
+        self._stride = width + 2
+        walls = 0
+        for x in range(-1, width + 1):
+            walls |= 1 << self._pos(x, -1) | 1 << self._pos(x, height)
+        for y in range(height):
+            walls |= 1 << self._pos(-1, y) | 1 << self._pos(width, y)
+        
         for y, row in enumerate(game_map):
             for x, cell in enumerate(row):
+                pos = self._pos(x, y)
                 if cell == '@' or cell == '+':
-                    player = (x, y)
+                    player = pos
                 if cell == '$' or cell == '*':
-                    boxes.append((x, y))
+                    boxes |= 1 << pos
                 if cell == '.' or cell == '*' or cell == '+':
-                    goals.append((x, y))
+                    goals.append(pos)
                 if cell == '#':
-                    walls.add((x, y))
+                    walls |= 1 << pos
+        
+        self.walls = walls  # Bitmask
+        self.goals = tuple(sorted(goals))
+        self.width = width
+        self.height = height
         
-        return SokobanState(player, boxes, goals, walls, width, height)
+        return SokobanState(player, boxes)
+    
+    @staticmethod
+    def _cells(mask: int) -> List[int]:
+        """Cell indices of the set bits in mask"""
+        cells = []
+        while mask:
+            lowest = mask & -mask
+            mask ^= lowest
+            cells.append(lowest.bit_length() - 1)
+        return cells
+    
+    def _flood(self, start: int, blocked: int) -> int:
+        """Bitmask of cells reachable from start without entering blocked"""
+        # Grow the whole frontier at once with shifts; the wall border keeps
+        # the +-1 shifts from wrapping between rows
+        stride = self._stride
+        open_cells = ~blocked
+        reached = 1 << start
+        while True:
+            grown = (reached | reached << 1 | reached >> 1
+                     | reached << stride | reached >> stride) & open_cells
+            if grown == reached:
+                return reached
+            reached = grown
+    
+    def _find_dead_cells(self) -> int:
+        """
+        Bitmask of dead squares: non-goal floor cells in a corner.
+        
+        A box pushed into a corner can never be moved again, so unless
+        that corner is a goal the puzzle becomes unsolvable.
+        """
+        walls = self.walls
+        goals = set(self.goals)
+        up, down, left, right = (self._deltas[m] for m in 'UDLR')
+        dead = 0
+        
+        for y in range(self.height):
+            for x in range(self.width):
+                pos = self._pos(x, y)
+                if walls >> pos & 1 or pos in goals:
+                    continue
+                vertical = walls >> (pos + up) & 1 or walls >> (pos + down) & 1
+                horizontal = walls >> (pos + left) & 1 or walls >> (pos + right) & 1
+                if vertical and horizontal:
+                    dead |= 1 << pos
+        
+        return dead
+    
+    def _goal_distances(self) -> List[int]:
+        """Manhattan distance from every cell to its nearest goal"""
+        goals = [self._xy(goal) for goal in self.goals]
+        size = self._stride * (self.height + 2)
+        table = [0] * size
+        
+        if goals:
+            for pos in range(size):
+                x, y = self._xy(pos)
+                table[pos] = min(abs(x - gx) + abs(y - gy) for gx, gy in goals)
+        
+        return table
     
     def _get_valid_moves(self, state: SokobanState) -> List[str]:
         """Get all valid moves from current state"""
         valid_moves = []
-        px, py = state.player
+        player = state.player
+        boxes = state.boxes
+        walls = self.walls
+        blocked = walls | boxes  # Cells a pushed box cannot enter
         
-        for direction, (dx, dy) in self.moves.items():
-            new_x, new_y = px + dx, py + dy
+        for direction, delta in self._steps:
+            new_pos = player + delta
             
             # Check if new position is a wall
-            if (new_x, new_y) in state.walls:
+            if walls >> new_pos & 1:
                 continue
             
             # Check if there's a box at the new position
-            if (new_x, new_y) in state.boxes:
-                # Check if we can push the box
-                box_new_x, box_new_y = new_x + dx, new_y + dy
-                
+            if boxes >> new_pos & 1:
                 # Box would hit a wall or another box
-                if (box_new_x, box_new_y) in state.walls or \
-                   (box_new_x, box_new_y) in state.boxes:
+                if blocked >> (new_pos + delta) & 1:
                     continue
             
             valid_moves.append(direction)
         
         return valid_moves
     
-    def _apply_move(self, state: SokobanState, move: str) -> SokobanState:
-        """Apply a move and return new state"""
-        dx, dy = self.moves[move]
-        px, py = state.player
-        new_x, new_y = px + dx, py + dy
+    def _apply_move(self, state: SokobanState, move: str) -> Optional[SokobanState]:
+        """Apply a move and return new state (None if a box hits a dead square)"""
+        delta = self._deltas[move]
+        new_pos = state.player + delta
         
-        new_boxes = list(state.boxes)
+        new_boxes = state.boxes
         
         # Check if pushing a box
-        if (new_x, new_y) in state.boxes:
-            box_idx = new_boxes.index((new_x, new_y))
-            new_boxes[box_idx] = (new_x + dx, new_y + dy)
-        
-        return SokobanState(
-            (new_x, new_y),
-            new_boxes,
-            list(state.goals),
-            state.walls,
-            state.width,
-            state.height
-        )
+        if new_boxes >> new_pos & 1:
+            new_boxes ^= 1 << new_pos | 1 << (new_pos + delta)
+            if new_boxes & self.dead_mask:
+                return None
+        
+        return SokobanState(new_pos, new_boxes)
+    
+    def _push_moves(self, state: SokobanState) -> List[Tuple[str, SokobanState]]:
+        """(move, successor) pairs for every legal forward move"""
+        successors = []
+        for move in self._get_valid_moves(state):
+            new_state = self._apply_move(state, move)
+            if new_state is not None:
+                successors.append((move, new_state))
+        return successors
+    
+    def _pull_moves(self, state: SokobanState) -> List[Tuple[str, SokobanState]]:
+        """
+        (move, predecessor) pairs: states from which the forward move
+        `move` leads to state. Used by the backward half of the
+        bidirectional search, where pushes become pulls.
+        """
+        predecessors = []
+        player = state.player
+        boxes = state.boxes
+        blocked = self.walls | boxes
+        
+        for direction, delta in self._steps:
+            # The player must have come from the cell behind it
+            prev = player - delta
+            if blocked >> prev & 1:
+                continue
+            
+            predecessors.append((direction, SokobanState(prev, boxes)))
+            
+            # ...or that same step pushed the box now in front of it
+            box = player + delta
+            if boxes >> box & 1 and not self.dead_mask >> player & 1:
+                pulled = boxes ^ (1 << box | 1 << player)
+                predecessors.append((direction, SokobanState(prev, pulled)))
+        
+        return predecessors
+    
+    def _box_pushes(self, state: SokobanState) -> List[Tuple[Tuple[int, str], SokobanState, int]]:
+        """
+        ((box cell, direction), successor, cost) for every box push the
+        player can walk to and make. Cost counts the walk plus the push;
+        in the successor the player stands where the box was.
+        """
+        pushes = []
+        player = state.player
+        boxes = state.boxes
+        blocked = self.walls | boxes
+        no_box = blocked | self.dead_mask  # Cells a pushed box must avoid
+        
+        # Walking distance from the player to every cell it can reach
+        distance = {player: 0}
+        queue = deque([player])
+        while queue:
+            pos = queue.popleft()
+            for _, delta in self._steps:
+                neighbor = pos + delta
+                if neighbor not in distance and not blocked >> neighbor & 1:
+                    distance[neighbor] = distance[pos] + 1
+                    queue.append(neighbor)
+        
+        for box in self._cells(boxes):
+            for direction, delta in self._steps:
+                target = box + delta
+                walk = distance.get(box - delta)
+                if walk is None or no_box >> target & 1:
+                    continue
+                
+                new_boxes = boxes ^ (1 << box | 1 << target)
+                pushes.append(((box, direction), SokobanState(box, new_boxes), walk + 1))
+        
+        return pushes
+    
+    def _walk(self, start: int, goal: int, boxes: int) -> List[str]:
+        """Shortest list of non-pushing moves from start to goal"""
+        blocked = self.walls | boxes
+        came_from = {start: None}
+        queue = deque([start])
+        
+        while queue:
+            pos = queue.popleft()
+            if pos == goal:
+                break
+            for direction, delta in self._steps:
+                neighbor = pos + delta
+                if neighbor not in came_from and not blocked >> neighbor & 1:
+                    came_from[neighbor] = (pos, direction)
+                    queue.append(neighbor)
+        
+        moves = []
+        while came_from[goal] is not None:
+            goal, direction = came_from[goal]
+            moves.append(direction)
+        moves.reverse()
+        return moves
+    
+    def _expand_pushes(self, pushes: List[Tuple[int, str]]) -> str:
+        """Turn a list of (box cell, direction) pushes into single-step moves"""
+        path = []
+        player = self.initial_state.player
+        boxes = self.initial_state.boxes
+        
+        for box, direction in pushes:
+            delta = self._deltas[direction]
+            path.extend(self._walk(player, box - delta, boxes))
+            path.append(direction)
+            boxes ^= 1 << box | 1 << (box + delta)
+            player = box
+        
+        return ''.join(path)
+    
+    def _is_goal(self, state: SokobanState) -> bool:
+        """Check if all boxes are on goals (box and goal counts match)"""
+        return (state.boxes & ~self._goal_mask) == 0
     
     def _heuristic(self, state: SokobanState) -> int:
-        """Manhattan distance heuristic for A*"""
+        """Manhattan distance heuristic for A* (precomputed per cell)"""
         total_distance = 0
+        min_goal_dist = self.min_goal_dist
         
-        for box in state.boxes:
-            min_distance = float('inf')
-            for goal in state.goals:
-                distance = abs(box[0] - goal[0]) + abs(box[1] - goal[1])
-                min_distance = min(min_distance, distance)
-            total_distance += min_distance
+        # Walk the set bits of the box mask
+        remaining = state.boxes
+        while remaining:
+            lowest = remaining & -remaining
+            remaining ^= lowest
+            total_distance += min_goal_dist[lowest.bit_length() - 1]
         
         return total_distance
     
-    def solve_bfs(self, max_nodes: int = 10000) -> Optional[Dict]:
+    def _solve_numba(self, mode: int, name: str, max_nodes: int,
+                     max_depth: int = 0) -> SolveResponse:
+        """Run the compiled search kernel from solver_numba"""
+        start_time = time.time()
+        state = self.initial_state
+        
+        wall_grid, goal_grid, goal_dist = solver_numba.encode_grid(
+            self._stride, self.height + 2, self.walls, self.dead_mask,
+            self.goals, self.min_goal_dist)
+        start = solver_numba.encode_state(state.player, state.boxes)
+        
+        goal, nodes_explored, parent, move = solver_numba.search(
+            wall_grid, goal_grid, goal_dist, self._stride, start, mode,
+            max_nodes, max_depth)
+        
+        if goal != -1:
+            return SolveResponse(
+                success=True,
+                path=solver_numba.build_path(goal, parent, move),
+                nodes_explored=nodes_explored,
+                time=time.time() - start_time,
+                algorithm=name
+            )
+        
+        return SolveResponse(
+            success=False,
+            error='No solution found or timeout',
+            nodes_explored=nodes_explored,
+            time=time.time() - start_time
+        )
+    
+    def _solve_numba_pushes(self, max_nodes: int) -> SolveResponse:
+        """Run the compiled push-level A* kernel from solver_numba"""
+        start_time = time.time()
+        state = self.initial_state
+        
+        wall_grid, goal_grid, goal_dist = solver_numba.encode_grid(
+            self._stride, self.height + 2, self.walls, self.dead_mask,
+            self.goals, self.min_goal_dist)
+        start = solver_numba.encode_state(state.player, state.boxes)
+        
+        goal, nodes_explored, parent, push_box, push_dir = solver_numba.search_pushes(
+            wall_grid, goal_grid, goal_dist, self._stride, start, max_nodes)
+        
+        if goal != -1:
+            pushes = solver_numba.build_pushes(goal, parent, push_box, push_dir)
+            return SolveResponse(
+                success=True,
+                path=self._expand_pushes(pushes),
+                nodes_explored=nodes_explored,
+                time=time.time() - start_time,
+                algorithm='A*'
+            )
+        
+        return SolveResponse(
+            success=False,
+            error='No solution found or timeout',
+            nodes_explored=nodes_explored,
+            time=time.time() - start_time
+        )
+    
+    def _build_path(self, nodes: List[Tuple], node_idx: int) -> List:
+        """Follow parent pointers from node_idx back to the root"""
+        path = []
+        while node_idx != -1:
+            _, node_idx, move = nodes[node_idx]
+            if move is not None:
+                path.append(move)
+        path.reverse()
+        return path
+    
+    def solve_bfs(self, max_nodes: int = 10000) -> SolveResponse:
         """Solve using Breadth-First Search"""
+        if self.use_numba:
+            return self._solve_numba(solver_numba.MODE_BFS, 'BFS', max_nodes)
+        
         start_time = time.time()
         
-        queue = deque([(self.initial_state, [])])
+        # Search tree as (state, parent index, move); the queue holds indices
+        nodes = [(self.initial_state, -1, None)]
+        queue = deque([0])
         visited = {self.initial_state}
         nodes_explored = 0
         
         while queue and nodes_explored < max_nodes:
-            state, path = queue.popleft()
+            node_idx = queue.popleft()
+            state = nodes[node_idx][0]
             nodes_explored += 1
             
-            if state.is_goal():
-                return {
-                    'success': True,
-                    'path': path,
-                    'nodes_explored': nodes_explored,
-                    'time': time.time() - start_time,
-                    'algorithm': 'BFS'
-                }
+            if self._is_goal(state):
+                return SolveResponse(
+                    success=True,
+                    path=''.join(self._build_path(nodes, node_idx)),
+                    nodes_explored=nodes_explored,
+                    time=time.time() - start_time,
+                    algorithm='BFS'
+                )
             
             for move in self._get_valid_moves(state):
                 new_state = self._apply_move(state, move)
                 
-                if new_state not in visited:
+                if new_state is not None and new_state not in visited:
                     visited.add(new_state)
-                    queue.append((new_state, path + [move]))
+                    queue.append(len(nodes))
+                    nodes.append((new_state, node_idx, move))
         
-        return {
-            'success': False,
-            'error': 'No solution found or timeout',
-            'nodes_explored': nodes_explored,
-            'time': time.time() - start_time
-        }
+        return SolveResponse(
+            success=False,
+            error='No solution found or timeout',
+            nodes_explored=nodes_explored,
+            time=time.time() - start_time
+        )
     
-    def solve_dfs(self, max_nodes: int = 10000, max_depth: int = 50) -> Optional[Dict]:
+    def solve_dfs(self, max_nodes: int = 10000, max_depth: int = 50) -> SolveResponse:
         """Solve using Depth-First Search"""
+        if self.use_numba:
+            return self._solve_numba(solver_numba.MODE_DFS, 'DFS', max_nodes, max_depth)
+        
         start_time = time.time()
         
-        stack = [(self.initial_state, [])]
+        # Search tree as (state, parent index, move); the stack holds
+        # (index, depth) pairs
+        nodes = [(self.initial_state, -1, None)]
+        stack = [(0, 0)]
         visited = {self.initial_state}
         nodes_explored = 0
         
         while stack and nodes_explored < max_nodes:
-            state, path = stack.pop()
+            node_idx, depth = stack.pop()
+            state = nodes[node_idx][0]
             nodes_explored += 1
             
-            if len(path) > max_depth:
+            if depth > max_depth:
                 continue
             
-            if state.is_goal():
-                return {
-                    'success': True,
-                    'path': path,
-                    'nodes_explored': nodes_explored,
-                    'time': time.time() - start_time,
-                    'algorithm': 'DFS'
-                }
+            if self._is_goal(state):
+                return SolveResponse(
+                    success=True,
+                    path=''.join(self._build_path(nodes, node_idx)),
+                    nodes_explored=nodes_explored,
+                    time=time.time() - start_time,
+                    algorithm='DFS'
+                )
             
             for move in self._get_valid_moves(state):
                 new_state = self._apply_move(state, move)
                 
-                if new_state not in visited:
+                if new_state is not None and new_state not in visited:
                     visited.add(new_state)
-                    stack.append((new_state, path + [move]))
+                    stack.append((len(nodes), depth + 1))
+                    nodes.append((new_state, node_idx, move))
         
-        return {
-            'success': False,
-            'error': 'No solution found or timeout',
-            'nodes_explored': nodes_explored,
-            'time': time.time() - start_time
-        }
+        return SolveResponse(
+            success=False,
+            error='No solution found or timeout',
+            nodes_explored=nodes_explored,
+            time=time.time() - start_time
+        )
     
-    def solve_astar(self, max_nodes: int = 10000) -> Optional[Dict]:
-        """Solve using A* Search"""
+    def solve_astar(self, max_nodes: int = 10000) -> SolveResponse:
+        """
+        Solve using A* Search over box pushes
+        
+        Each edge is one push, costing the walk to the box plus one, so
+        walking around without touching a box never creates new states.
+        A state keeps the player's exact cell (where the last pushed box
+        was) rather than just its reachable region: the next walk's length
+        depends on it, and merging such states would lose shortest paths.
+        The heuristic is consistent with these costs, so the solution has
+        the fewest moves; walks are filled in afterwards with shortest routes.
+        """
+        if self.use_numba:
+            return self._solve_numba_pushes(max_nodes)
+        
         start_time = time.time()
         
-        # Priority queue: (f_score, counter, state, path, g_score)
+        root = self.initial_state
+        
+        # Search tree as (state, parent index, push)
+        # Priority queue: (f_score, counter, g_score, node index) - all ints,
+        # so heapq never has to compare states
+        nodes = [(root, -1, None)]
+        best_g = {root: 0}
         counter = 0
-        open_set = [(self._heuristic(self.initial_state), counter, self.initial_state, [], 0)]
-        visited = set()
+        open_set = [(self._heuristic(root), counter, 0, 0)]
         nodes_explored = 0
         
         while open_set and nodes_explored < max_nodes:
-            f_score, _, state, path, g_score = heapq.heappop(open_set)
+            f_score, _, g_score, node_idx = heapq.heappop(open_set)
+            state = nodes[node_idx][0]
             
-            if state in visited:
+            # Stale entry: a cheaper path to this state was pushed later
+            if g_score > best_g[state]:
                 continue
             
-            visited.add(state)
             nodes_explored += 1
             
-            if state.is_goal():
-                return {
-                    'success': True,
-                    'path': path,
-                    'nodes_explored': nodes_explored,
-                    'time': time.time() - start_time,
-                    'algorithm': 'A*'
-                }
+            if self._is_goal(state):
+                return SolveResponse(
+                    success=True,
+                    path=self._expand_pushes(self._build_path(nodes, node_idx)),
+                    nodes_explored=nodes_explored,
+                    time=time.time() - start_time,
+                    algorithm='A*'
+                )
+            
+            for move, new_state, cost in self._box_pushes(state):
+                new_g = g_score + cost
+                if new_g >= best_g.get(new_state, INF):
+                    continue
+                
+                best_g[new_state] = new_g
+                new_f = new_g + self._heuristic(new_state)
+                counter += 1
+                heapq.heappush(open_set, (new_f, counter, new_g, len(nodes)))
+                nodes.append((new_state, node_idx, move))
+        
+        return SolveResponse(
+            success=False,
+            error='No solution found or timeout',
+            nodes_explored=nodes_explored,
+            time=time.time() - start_time
+        )
+    
+    def solve_idastar(self, max_nodes: int = 10000) -> SolveResponse:
+        """
+        Solve using Iterative Deepening A*
+        
+        Repeated depth-first passes bounded by f = g + h. Memory is only the
+        current path, at the cost of re-expanding shallow states each pass.
+        """
+        start_time = time.time()
+        
+        found = -1  # Sentinel returned by _search when a goal is reached
+        path = []
+        on_path = {self.initial_state}
+        nodes_explored = 0
+        
+        def _search(state: SokobanState, g_score: int, f_limit: int):
+            nonlocal nodes_explored
+            
+            f_score = g_score + self._heuristic(state)
+            if f_score > f_limit:
+                return f_score
+            if nodes_explored >= max_nodes:
+                return INF
+            
+            nodes_explored += 1
+            
+            if self._is_goal(state):
+                return found
             
+            next_limit = INF
             for move in self._get_valid_moves(state):
                 new_state = self._apply_move(state, move)
                 
-                if new_state not in visited:
-                    new_g = g_score + 1
-                    new_h = self._heuristic(new_state)
-                    new_f = new_g + new_h
-                    counter += 1
-                    heapq.heappush(open_set, (new_f, counter, new_state, path + [move], new_g))
-        
-        return {
-            'success': False,
-            'error': 'No solution found or timeout',
-            'nodes_explored': nodes_explored,
-            'time': time.time() - start_time
-        }
-    
-    def solve(self, algorithm: str = 'astar') -> Dict:
+                if new_state is None or new_state in on_path:
+                    continue
+                
+                path.append(move)
+                on_path.add(new_state)
+                result = _search(new_state, g_score + 1, f_limit)
+                if result == found:
+                    return found
+                path.pop()
+                on_path.discard(new_state)
+                
+                next_limit = min(next_limit, result)
+            
+            return next_limit
+        
+        f_limit = self._heuristic(self.initial_state)
+        while f_limit < INF and nodes_explored < max_nodes:
+            f_limit = _search(self.initial_state, 0, f_limit)
+            
+            if f_limit == found:
+                return SolveResponse(
+                    success=True,
+                    path=''.join(path),
+                    nodes_explored=nodes_explored,
+                    time=time.time() - start_time,
+                    algorithm='IDA*'
+                )
+        
+        return SolveResponse(
+            success=False,
+            error='No solution found or timeout',
+            nodes_explored=nodes_explored,
+            time=time.time() - start_time
+        )
+    
+    def solve_bidirectional(self, max_nodes: int = 10000) -> SolveResponse:
+        """
+        Solve using bidirectional BFS
+        
+        A forward BFS from the start meets a backward BFS (pulling boxes)
+        from every solved position: the boxes on any choice of goals
+        (there may be spare goals), player on any free cell. Each round
+        expands one whole layer of the smaller frontier, so a shortest
+        solution of length d is found after about b^(d/2) nodes per side
+        instead of b^d.
+        """
+        start_time = time.time()
+        
+        # Per side: search tree as (state, parent index, move), depth per
+        # node, state -> node index, and the frontier layer of node indices
+        forward = ([(self.initial_state, -1, None)], [0], {self.initial_state: 0}, [0])
+        
+        backward = ([], [], {}, [])
+        interior = self._flood(self.initial_state.player, self.walls)
+        box_count = len(self._cells(self.initial_state.boxes))
+        for placement in combinations(self.goals, box_count):
+            boxes = sum(1 << goal for goal in placement)
+            for player in self._cells(interior & ~boxes):
+                state = SokobanState(player, boxes)
+                backward[2][state] = len(backward[0])
+                backward[3].append(len(backward[0]))
+                backward[0].append((state, -1, None))
+                backward[1].append(0)
+        
+        nodes_explored = 0
+        best = None  # (length, forward node index, backward node index)
+        layer_done = True  # A meeting is only shortest once its layer is done
+        
+        meeting = backward[2].get(self.initial_state)
+        if meeting is not None:
+            best = (0, 0, meeting)
+        
+        while best is None and forward[3] and backward[3] and nodes_explored < max_nodes:
+            is_forward = len(forward[3]) <= len(backward[3])
+            if is_forward:
+                (nodes, depth, index, layer), other = forward, backward
+                successors = self._push_moves
+            else:
+                (nodes, depth, index, layer), other = backward, forward
+                successors = self._pull_moves
+            
+            next_layer = []
+            for node_idx in layer:
+                if nodes_explored >= max_nodes:
+                    layer_done = False
+                    break
+                nodes_explored += 1
+                
+                for move, new_state in successors(nodes[node_idx][0]):
+                    if new_state in index:
+                        continue
+                    
+                    new_idx = len(nodes)
+                    index[new_state] = new_idx
+                    nodes.append((new_state, node_idx, move))
+                    depth.append(depth[node_idx] + 1)
+                    next_layer.append(new_idx)
+                    
+                    # Finish the layer so the shortest meeting wins
+                    other_idx = other[2].get(new_state)
+                    if other_idx is not None:
+                        length = depth[new_idx] + other[1][other_idx]
+                        if best is None or length < best[0]:
+                            if is_forward:
+                                best = (length, new_idx, other_idx)
+                            else:
+                                best = (length, other_idx, new_idx)
+            
+            layer[:] = next_layer
+        
+        if best is not None and layer_done:
+            _, forward_idx, backward_idx = best
+            path = self._build_path(forward[0], forward_idx)
+            
+            # Backward moves are already forward moves toward the goal
+            while backward_idx != -1:
+                _, backward_idx, move = backward[0][backward_idx]
+                if move is not None:
+                    path.append(move)
+            
+            return SolveResponse(
+                success=True,
+                path=''.join(path),
+                nodes_explored=nodes_explored,
+                time=time.time() - start_time,
+                algorithm='Bidirectional BFS'
+            )
+        
+        return SolveResponse(
+            success=False,
+            error='No solution found or timeout',
+            nodes_explored=nodes_explored,
+            time=time.time() - start_time
+        )
+    
+    def solve(self, algorithm: str = 'astar') -> SolveResponse:
         """Solve the puzzle using the specified algorithm"""
         if algorithm.lower() == 'bfs':
             return self.solve_bfs()
@@ -262,8 +749,12 @@ class SokobanSolver:
             return self.solve_dfs()
         elif algorithm.lower() == 'astar':
             return self.solve_astar()
+        elif algorithm.lower() == 'idastar':
+            return self.solve_idastar()
+        elif algorithm.lower() == 'bidirectional':
+            return self.solve_bidirectional()
         else:
-            return {'success': False, 'error': f'Unknown algorithm: {algorithm}'}
+            return SolveResponse(success=False, error=f'Unknown algorithm: {algorithm}')
 
 
 # Example usage
@@ -282,17 +773,17 @@ if __name__ == '__main__':
     
     print("Testing all algorithms:\n")
     
-    for algo in ['bfs', 'dfs', 'astar']:
+    for algo in ['bfs', 'dfs', 'astar', 'idastar', 'bidirectional']:
         print(f"\n{algo.upper()} Algorithm:")
         print("-" * 40)
         result = solver.solve(algo)
         
-        if result['success']:
+        if result.success:
             print(f"✓ Solution found!")
-            print(f"  Moves: {len(result['path'])}")
-            print(f"  Path: {' → '.join(result['path'])}")
-            print(f"  Nodes explored: {result['nodes_explored']}")
-            print(f"  Time: {result['time']:.4f} seconds")
+            print(f"  Moves: {len(result.path)}")
+            print(f"  Path: {' → '.join(result.path)}")
+            print(f"  Nodes explored: {result.nodes_explored}")
+            print(f"  Time: {result.time:.4f} seconds")
         else:
-            print(f"✗ {result['error']}")
-            print(f"  Nodes explored: {result['nodes_explored']}")
\ No newline at end of file
+            print(f"✗ {result.error}")
+            print(f"  Nodes explored: {result.nodes_explored}")
\ No newline at end of file
@@ -0,0 +1,430 @@
+"""
+Sokoban Solver - Numba search kernels
+Compiled BFS, DFS, and push-level A* over an integer grid encoding
+"""
+
+import numpy as np
+from numba import njit
+
+# Search modes understood by search()
+MODE_BFS = 0
+MODE_DFS = 1
+
+# wall_grid cell values
+FLOOR = 0
+WALL = 1
+DEAD = 2  # Floor the player may enter but a box must not be pushed onto
+
+# Same order as SokobanSolver.MOVES so paths and node counts match
+MOVE_CHARS = 'UDLR'
+
+
+def encode_grid(stride: int, rows: int, walls: int, dead: int, goals,
+                goal_dist):
+    """
+    Build the flat grids used by the kernels.
+
+    Cells use SokobanSolver's padded indexing, so walls and dead are the
+    solver's wall and dead-square bitmasks, goals is a sequence of cell
+    indices, and goal_dist is the solver's per-cell nearest-goal table.
+    """
+    size = stride * rows
+
+    wall_grid = np.zeros(size, np.uint8)
+    for pos in range(size):
+        if walls >> pos & 1:
+            wall_grid[pos] = WALL
+        elif dead >> pos & 1:
+            wall_grid[pos] = DEAD
+
+    goal_grid = np.zeros(size, np.uint8)
+    goal_grid[list(goals)] = 1
+
+    return wall_grid, goal_grid, np.asarray(goal_dist, np.int32)
+
+
+def encode_state(player: int, boxes: int):
+    """Pack a player cell and box bitmask into a kernel state row"""
+    cells = []
+    while boxes:
+        lowest = boxes & -boxes
+        boxes ^= lowest
+        cells.append(lowest.bit_length() - 1)
+    return np.array([player] + cells, np.int32)
+
+
+@njit(cache=True)
+def _hash_row(row):
+    # FNV-1a over the player + sorted box positions
+    h = np.uint64(14695981039346656037)
+    for v in row:
+        h = (h ^ np.uint64(v)) * np.uint64(1099511628211)
+    return h
+
+
+@njit(cache=True)
+def _find(table, mask, states, row):
+    """Return (node index, slot) for row; node index is -1 if absent"""
+    slot = np.int64(_hash_row(row) & np.uint64(mask))
+    n = row.shape[0]
+    while True:
+        k = table[slot]
+        if k == -1:
+            return -1, slot
+        same = True
+        for j in range(n):
+            if states[k, j] != row[j]:
+                same = False
+                break
+        if same:
+            return k, slot
+        slot = (slot + 1) & mask
+
+
+@njit(cache=True)
+def _is_goal(row, goal_grid):
+    for j in range(1, row.shape[0]):
+        if goal_grid[row[j]] == 0:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _heuristic(row, goal_dist):
+    total = 0
+    for j in range(1, row.shape[0]):
+        total += goal_dist[row[j]]
+    return total
+
+
+@njit(cache=True)
+def _successor(row, d, wall_grid, out):
+    """
+    Write the state reached by moving in offset d into out.
+
+    Returns False if the move is blocked or pushes a box onto a dead
+    square. Boxes are kept sorted so that equal states have equal rows.
+    """
+    player = row[0]
+    target = player + d
+    if wall_grid[target] == WALL:
+        return False
+
+    n = row.shape[0]
+    pushed = -1
+    for j in range(1, n):
+        if row[j] == target:
+            pushed = j
+            break
+
+    if pushed != -1:
+        beyond = target + d
+        if wall_grid[beyond] != FLOOR:
+            return False
+        for j in range(1, n):
+            if row[j] == beyond:
+                return False
+
+    out[0] = target
+    for j in range(1, n):
+        out[j] = row[j]
+    if pushed != -1:
+        out[pushed] = target + d
+        # Restore sort order with a single insertion pass
+        j = pushed
+        while j > 1 and out[j - 1] > out[j]:
+            out[j - 1], out[j] = out[j], out[j - 1]
+            j -= 1
+        while j < n - 1 and out[j + 1] < out[j]:
+            out[j + 1], out[j] = out[j], out[j + 1]
+            j += 1
+    return True
+
+
+@njit(cache=True)
+def _heap_push(hf, hc, hg, hn, size, f, c, g, node):
+    # Min-heap ordered by (f, counter); g and node ride along
+    i = size
+    while i > 0:
+        parent = (i - 1) >> 1
+        if hf[parent] < f or (hf[parent] == f and hc[parent] < c):
+            break
+        hf[i] = hf[parent]
+        hc[i] = hc[parent]
+        hg[i] = hg[parent]
+        hn[i] = hn[parent]
+        i = parent
+    hf[i] = f
+    hc[i] = c
+    hg[i] = g
+    hn[i] = node
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(hf, hc, hg, hn, size):
+    top_g = hg[0]
+    top = hn[0]
+    size -= 1
+    f = hf[size]
+    c = hc[size]
+    g = hg[size]
+    node = hn[size]
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and (hf[child + 1] < hf[child] or
+                                 (hf[child + 1] == hf[child] and hc[child + 1] < hc[child])):
+            child += 1
+        if f < hf[child] or (f == hf[child] and c < hc[child]):
+            break
+        hf[i] = hf[child]
+        hc[i] = hc[child]
+        hg[i] = hg[child]
+        hn[i] = hn[child]
+        i = child
+    hf[i] = f
+    hc[i] = c
+    hg[i] = g
+    hn[i] = node
+    return top_g, top, size
+
+
+@njit(cache=True)
+def search(wall_grid, goal_grid, goal_dist, stride, start, mode,
+           max_nodes, max_depth):
+    """
+    Run BFS or DFS from start (player followed by sorted boxes).
+
+    Returns (goal node or -1, nodes explored, parent array, move array).
+    Node semantics mirror SokobanSolver.solve_bfs/dfs exactly.
+    """
+    width = start.shape[0]
+    deltas = np.array([-stride, stride, -1, 1], np.int64)
+
+    # Every explored node yields at most 4 successors
+    cap = 4 * max_nodes + 1
+    states = np.empty((cap, width), np.int32)
+    parent = np.empty(cap, np.int32)
+    move = np.empty(cap, np.int8)
+    depth = np.empty(cap, np.int32)
+
+    table_size = 1
+    while table_size < 2 * cap:
+        table_size <<= 1
+    table = np.full(table_size, -1, np.int32)
+    mask = table_size - 1
+
+    states[0, :] = start
+    parent[0] = -1
+    move[0] = -1
+    depth[0] = 0
+    count = 1
+
+    scratch = np.empty(width, np.int32)
+    nodes_explored = 0
+
+    # table is the visited set, marked when a node is generated
+    found, slot = _find(table, mask, states, start)
+    table[slot] = 0
+    frontier = np.empty(cap, np.int32)
+    frontier[0] = 0
+    head = 0
+    tail = 1
+
+    while head < tail and nodes_explored < max_nodes:
+        if mode == MODE_BFS:
+            node = frontier[head]
+            head += 1
+        else:
+            tail -= 1
+            node = frontier[tail]
+        row = states[node]
+        nodes_explored += 1
+
+        if mode == MODE_DFS and depth[node] > max_depth:
+            continue
+
+        if _is_goal(row, goal_grid):
+            return node, nodes_explored, parent[:count], move[:count]
+
+        for m in range(4):
+            if not _successor(row, deltas[m], wall_grid, scratch):
+                continue
+            found, slot = _find(table, mask, states, scratch)
+            if found != -1:
+                continue
+            states[count, :] = scratch
+            parent[count] = node
+            move[count] = m
+            depth[count] = depth[node] + 1
+            table[slot] = count
+            frontier[tail] = count
+            tail += 1
+            count += 1
+
+    return -1, nodes_explored, parent[:count], move[:count]
+
+
+@njit(cache=True)
+def _walk_distances(start, wall_grid, box_grid, deltas, mark, stamp, dist, queue):
+    """BFS walking distances from start; dist is valid where mark == stamp"""
+    mark[start] = stamp
+    dist[start] = 0
+    queue[0] = start
+    head = 0
+    tail = 1
+    while head < tail:
+        pos = queue[head]
+        head += 1
+        for m in range(4):
+            neighbor = pos + deltas[m]
+            if mark[neighbor] != stamp and wall_grid[neighbor] != WALL and box_grid[neighbor] == 0:
+                mark[neighbor] = stamp
+                dist[neighbor] = dist[pos] + 1
+                queue[tail] = neighbor
+                tail += 1
+
+
+@njit(cache=True)
+def search_pushes(wall_grid, goal_grid, goal_dist, stride, start, max_nodes):
+    """
+    Push-level A* from start (player followed by sorted boxes).
+
+    States are (player cell, boxes) with the player where the last pushed
+    box was; edges are single pushes costing the walk to the box plus one.
+    Returns (goal node or -1, nodes explored, parent array, pushed box
+    cell array, push direction array). Node semantics mirror
+    SokobanSolver.solve_astar exactly.
+    """
+    width = start.shape[0]
+    deltas = np.array([-stride, stride, -1, 1], np.int64)
+    size = wall_grid.shape[0]
+
+    # Every explored node yields at most 4 pushes per box
+    cap = 4 * max(width - 1, 1) * max_nodes + 1
+    states = np.empty((cap, width), np.int32)
+    parent = np.empty(cap, np.int32)
+    push_box = np.empty(cap, np.int32)
+    push_dir = np.empty(cap, np.int8)
+    depth = np.empty(cap, np.int32)
+
+    table_size = 1
+    while table_size < 2 * cap:
+        table_size <<= 1
+    table = np.full(table_size, -1, np.int32)
+    mask = table_size - 1
+
+    # Visit marks are stamped rather than cleared between floods
+    box_grid = np.zeros(size, np.uint8)
+    walk_mark = np.zeros(size, np.int32)
+    dist = np.empty(size, np.int32)
+    queue = np.empty(size, np.int32)
+    walk_stamp = 0
+
+    states[0, :] = start
+    parent[0] = -1
+    push_box[0] = -1
+    push_dir[0] = -1
+    depth[0] = 0
+    count = 1
+
+    # table holds every generated state once and depth[] its best g;
+    # heap entries whose g is worse than depth[] are stale
+    hf = np.empty(cap, np.int64)
+    hc = np.empty(cap, np.int64)
+    hg = np.empty(cap, np.int32)
+    hn = np.empty(cap, np.int32)
+    found, slot = _find(table, mask, states, states[0])
+    table[slot] = 0
+    counter = 0
+    heap_size = _heap_push(hf, hc, hg, hn, 0, _heuristic(states[0], goal_dist),
+                           counter, 0, 0)
+
+    scratch = np.empty(width, np.int32)
+    nodes_explored = 0
+
+    while heap_size > 0 and nodes_explored < max_nodes:
+        g, node, heap_size = _heap_pop(hf, hc, hg, hn, heap_size)
+        if g > depth[node]:
+            continue
+        row = states[node]
+        nodes_explored += 1
+
+        if _is_goal(row, goal_grid):
+            return (node, nodes_explored, parent[:count], push_box[:count],
+                    push_dir[:count])
+
+        for j in range(1, width):
+            box_grid[row[j]] = 1
+        walk_stamp += 1
+        _walk_distances(row[0], wall_grid, box_grid, deltas, walk_mark, walk_stamp,
+                        dist, queue)
+
+        for j in range(1, width):
+            box = row[j]
+            for m in range(4):
+                d = deltas[m]
+                target = box + d
+                if (walk_mark[box - d] != walk_stamp or wall_grid[target] != FLOOR
+                        or box_grid[target]):
+                    continue
+
+                # Apply the push and keep boxes sorted
+                for k in range(width):
+                    scratch[k] = row[k]
+                scratch[j] = target
+                k = j
+                while k > 1 and scratch[k - 1] > scratch[k]:
+                    scratch[k - 1], scratch[k] = scratch[k], scratch[k - 1]
+                    k -= 1
+                while k < width - 1 and scratch[k + 1] < scratch[k]:
+                    scratch[k + 1], scratch[k] = scratch[k], scratch[k + 1]
+                    k += 1
+
+                scratch[0] = box
+
+                new_g = g + dist[box - d] + 1
+                found, slot = _find(table, mask, states, scratch)
+                if found == -1:
+                    found = count
+                    states[count, :] = scratch
+                    table[slot] = count
+                    count += 1
+                elif new_g >= depth[found]:
+                    continue
+                parent[found] = node
+                push_box[found] = box
+                push_dir[found] = m
+                depth[found] = new_g
+                counter += 1
+                heap_size = _heap_push(hf, hc, hg, hn, heap_size,
+                                       new_g + _heuristic(scratch, goal_dist),
+                                       counter, new_g, found)
+
+        for j in range(1, width):
+            box_grid[row[j]] = 0
+
+    return -1, nodes_explored, parent[:count], push_box[:count], push_dir[:count]
+
+
+def build_pushes(goal: int, parent, push_box, push_dir):
+    """Walk parent pointers back from goal and return (box cell, move) pushes"""
+    pushes = []
+    while parent[goal] != -1:
+        pushes.append((int(push_box[goal]), MOVE_CHARS[push_dir[goal]]))
+        goal = parent[goal]
+    pushes.reverse()
+    return pushes
+
+
+def build_path(goal: int, parent, move):
+    """Walk parent pointers back from goal and return the moves as a string"""
+    path = []
+    while parent[goal] != -1:
+        path.append(MOVE_CHARS[move[goal]])
+        goal = parent[goal]
+    path.reverse()
+    return ''.join(path)
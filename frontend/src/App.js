@@ -441,7 +441,7 @@ const SokobanFrontend = () => {
                 <div className="move-sequence">
                   <div className="move-sequence-label">Solution Path:</div>
                   <div className="move-sequence-text">
-                    {solution.map((move, i) => (
+                    {Array.from(solution).map((move, i) => (
                       <span 
                         key={i}
                         className={i < currentStep ? 'move-current' : ''}
@@ -464,9 +464,11 @@ const SokobanFrontend = () => {
           </h3>
           <div className="radio-group">
             {[
-              {value: 'astar', label: 'A* Search', desc: 'Optimal & Fast (Recommended)'},
+              {value: 'astar', label: 'A* Search', desc: 'Fewest moves & Fast (Recommended)'},
               {value: 'bfs', label: 'BFS', desc: 'Guarantees shortest path'},
-              {value: 'dfs', label: 'DFS', desc: 'Memory efficient'}
+              {value: 'dfs', label: 'DFS', desc: 'Memory efficient'},
+              {value: 'idastar', label: 'IDA*', desc: 'Optimal with minimal memory'},
+              {value: 'bidirectional', label: 'Bidirectional BFS', desc: 'Shortest path, meets in the middle'}
             ].map(({value, label, desc}) => (
               <label key={value} className="radio-option">
                 <input